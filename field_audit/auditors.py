@@ -48,18 +48,38 @@ class _AuditDispatcher:
         else:
             self.auditors = [RequestAuditor(), SystemUserAuditor()]
 
+    CACHE_ATTR = "_field_audit_change_context"
+
     def dispatch(self, request):
         """Cycles through the auditors chain and returns the first non-None
         value returned by a call to ``auditor.change_context(request)``.
 
+        Truthy results are memoized on the request object, so repeated
+        audited writes within a single request resolve the auditor chain
+        only once. Falsy results (e.g. the empty value returned for
+        unauthenticated requests) are not cached so a request that
+        authenticates mid-flight is re-audited.
+
         :param request: Django request to be audited (or ``None``).
         :returns: JSON-serializable value (or ``None`` if chain is exhausted).
         """
+        if request is not None:
+            try:
+                return getattr(request, self.CACHE_ATTR)
+            except AttributeError:
+                pass
+        change_context = None
         for auditor in self.auditors:
             change_context = auditor.change_context(request)
             if change_context is not None:
-                return change_context
-        return None
+                break
+        if request is not None and change_context:
+            try:
+                setattr(request, self.CACHE_ATTR, change_context)
+            except AttributeError:
+                # request objects that refuse attributes are not cached
+                pass
+        return change_context
 
 
 audit_dispatcher = _AuditDispatcher()
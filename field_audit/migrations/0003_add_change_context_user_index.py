@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('field_audit', '0002_add_is_bootstrap_column'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditevent',
+            index=models.Index(
+                models.F('change_context__user_type'),
+                models.F('change_context__username'),
+                name='field_audit_changectx_usr_idx',
+            ),
+        ),
+    ]
@@ -109,3 +109,17 @@ class PkAuto(Model):
 @audit_fields("id")
 class PkJson(Model):
     id = JSONField(primary_key=True)
+
+
+class TestModel(Model):
+    """Unaudited model used by ``tests.test_models`` for in-memory audit
+    logic tests. It is never persisted (see ``managed``) and is registered
+    as audited per test class via ``override_audited_models``.
+    """
+    __test__ = False  # this is not a test
+    value = IntegerField(null=True)
+    other = IntegerField(null=True)
+
+    class Meta:
+        # never persisted; skip table creation for the test database
+        managed = False
@@ -23,6 +23,10 @@ MIDDLEWARE = [
 
 SECRET_KEY = "test"
 
+# pin the pre-5.0 default so naive datetimes behave the same on all
+# supported Django versions
+USE_TZ = False
+
 # --------------------
 # field_audit settings
 #
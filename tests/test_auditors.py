@@ -86,6 +86,45 @@ class TestAuditDispatcher(TestCase):
         self.assertEqual(aud1.dispatched, 1)
         self.assertEqual(aud2.dispatched, 1)
 
+    def test_audit_dispatcher_caches_result_per_request(self):
+        aud = MockAuditor(True)
+
+        class Request:
+            pass
+
+        request = Request()
+        with patch.object(audit_dispatcher, "auditors", [aud]):
+            first = audit_dispatcher.dispatch(request)
+            second = audit_dispatcher.dispatch(request)
+        self.assertIs(first, second)
+        self.assertEqual(aud.dispatched, 1)
+
+    def test_audit_dispatcher_does_not_cache_falsy_results(self):
+
+        class FalsyAuditor(MockAuditor):
+
+            def change_context(self, request):
+                self.dispatched += 1
+                return {}
+
+        class Request:
+            pass
+
+        aud = FalsyAuditor(True)
+        request = Request()
+        with patch.object(audit_dispatcher, "auditors", [aud]):
+            self.assertEqual({}, audit_dispatcher.dispatch(request))
+            self.assertEqual({}, audit_dispatcher.dispatch(request))
+        self.assertEqual(aud.dispatched, 2)
+        self.assertFalse(hasattr(request, audit_dispatcher.CACHE_ATTR))
+
+    def test_audit_dispatcher_does_not_cache_without_request(self):
+        aud = MockAuditor(True)
+        with patch.object(audit_dispatcher, "auditors", [aud]):
+            audit_dispatcher.dispatch(None)
+            audit_dispatcher.dispatch(None)
+        self.assertEqual(aud.dispatched, 2)
+
 
 class CustomAuditor1(BaseAuditor):
     pass